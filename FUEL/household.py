@@ -1,12 +1,124 @@
+from collections.abc import Iterable
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from scipy.signal import find_peaks
 
+_DAY_NS = 86400 * 10**9  # nanoseconds in a day
+
+
+def _significant_changes(weights, threshold, minimum_weight):
+    '''Find all significant weight changes in a series of fuel weight readings (internal function).
+
+    Args:
+        weights (array): Fuel weight readings (kg).
+        threshold (float): Minimum weight change (kg) that is considered significant.
+        minimum_weight (float): Readings below this weight (kg) are ignored.
+
+    Returns:
+        weight_changes (array): Indices of all readings that resulted in a change of fuel weight larger than the
+                                threshold.
+    '''
+
+    data = weights.tolist()  # python floats are much faster to compare than numpy or pandas scalars
+    last = len(data) - 1
+    weight = data[0]
+    weight_changes = []
+
+    for i in range(1, len(data)):
+        current_weight = data[i]
+        if current_weight < minimum_weight:
+            continue
+        if i == last:
+            if data[i-1] < weight:
+                weight_changes.append(i)
+            continue
+
+        weight_diff = current_weight - weight
+        if abs(weight_diff) < threshold:
+            continue
+        # check to make sure it isnt catching random peaks
+        if weight_diff > threshold:
+            weight_before = data[i-1]
+            weight_after = data[i+1]
+            if abs(weight_after-weight_before) < threshold or weight_after < weight_before:
+                continue
+        weight_changes.append(i)
+        weight = current_weight
+
+    return np.array(weight_changes, dtype=np.int64)
+
+
+def _cooking_boundaries(temps, peaks, threshold, readings_below=5):
+    '''Find the start and end of the cooking event around each temperature peak (internal function).
+
+    A cooking event starts after, and ends with, a run of readings_below consecutive readings under the threshold.
+    The runs are located once for the whole stove and each peak is matched to its nearest runs with a binary search.
+
+    Args:
+        temps (array): Stove temperature readings.
+        peaks (array): Indices of the cooking event peaks.
+        threshold (int): Temperature threshold (degrees) for cooking events.
+        readings_below (int): Number of consecutive readings below the threshold that mark the edge of an event.
+
+    Returns:
+        start (array): Index of the start of each cooking event, 0 if no start could be found.
+        end (array): Index of the end of each cooking event, 0 if no end could be found.
+    '''
+
+    n = len(temps)
+    m = max(n - readings_below + 1, 0)
+    below = temps < threshold
+    runs = below[:m].copy()
+    for k in range(1, readings_below):
+        runs &= below[k:k+m]
+    run_starts = np.flatnonzero(runs)  # first index of every run of readings below the threshold
+    peaks = np.asarray(peaks, dtype=np.int64)
+
+    # the last run that ends before the peak, the first two readings are never searched
+    before = np.searchsorted(run_starts, peaks - readings_below + 1, side='left') - 1
+    start = np.zeros(len(peaks), dtype=np.int64)
+    found = before >= 0
+    start[found] = run_starts[before[found]] + 1
+    start[start < 3] = 0
+
+    # the first run that begins at the peak, the last two readings are never searched
+    after = np.searchsorted(run_starts, peaks, side='left')
+    end = np.full(len(peaks), n - 1, dtype=np.int64)
+    found = after < len(run_starts)
+    end[found] = run_starts[after[found]] + readings_below - 1
+    end[end > n - 3] = n - 1
+    end[peaks >= n - 1] = 0
+
+    return start, end
+
+
+def _daily_totals(study_day, amounts, study_days):
+    '''Sum amounts into the day of the study they were recorded on (internal function).
+
+    Args:
+        study_day (array): Day of the study (0 is the first 24hrs) each amount was recorded on.
+        amounts (array): Amounts to be summed.
+        study_days (int): Number of days in the study.
+
+    Returns:
+        daily_totals (array): The index is the day of the study starting at 1, values are the summed amounts. Anything
+                              after the last full day of the study is counted in the last day. Index 0 is the total.
+    '''
+
+    day = np.minimum(study_day + 1, study_days)
+    daily_totals = np.bincount(day, weights=amounts, minlength=study_days + 1)
+    daily_totals[0] = sum(daily_totals.tolist())  # summed in order so it equals the sum of the days exactly
+
+    return daily_totals
+
 
 class Household:
 
-    def __init__(self, dataframe, stoves, fuels, hh_id, temp_threshold=15, time_between_events=60,weight_threshold=0.2):
+    def __init__(self, dataframe, stoves, fuels, hh_id, temp_threshold=15, time_between_events=60,weight_threshold=0.2,
+                 dtype=np.float64):
         '''Verifying that the input arguments are in the correct formats and set self values
 
         Args:
@@ -31,6 +143,11 @@ class Household:
             weight_threshold (float): The weight change (kg) that should be ignored. All weight changes above this
                                       value will be marked. Defaults to 0.2 kg.
 
+            dtype (type): The floating point type (numpy.float32 or numpy.float64) the stove and fuel readings are
+                          stored in. numpy.float32 halves the memory used by the cached readings, which is plenty of
+                          precision for most sensors but can move changes that are right at a threshold. Weight
+                          comparisons and daily totals are always done in float64. Defaults to numpy.float64.
+
         Returns:
             df_stoves : Input dataframe
             stoves : Input stoves
@@ -43,22 +160,28 @@ class Household:
 
         '''
 
-        if isinstance(dataframe, pd.DataFrame):
-            pass
-        else:
+        if not isinstance(dataframe, pd.DataFrame):
             raise ValueError("Must put in a dataframe!")
-        if type(stoves) != list:
+        if not isinstance(stoves, list):
             raise ValueError('Must put in a list of stove types!')
-        if type(fuels) != list:
+        if not isinstance(fuels, list):
             raise ValueError('Must put in a list of fuel types!')
-        if type(hh_id) != str:
+        if not isinstance(hh_id, str):
             raise ValueError('Must put in household ID as a string!')
-        if type(time_between_events) != int or time_between_events < 0:
+        # bool is a subclass of int but is not a valid threshold
+        if isinstance(time_between_events, bool) or not isinstance(time_between_events, int) \
+                or time_between_events < 0:
             raise ValueError("The time between events must be a positive integer!")
-        if type(temp_threshold) != int or temp_threshold < 0:
+        if isinstance(temp_threshold, bool) or not isinstance(temp_threshold, int) or temp_threshold < 0:
             raise ValueError("The temperature threshold must be a positive integer!")
-        if type(weight_threshold) != float or weight_threshold < 0:
+        if not isinstance(weight_threshold, float) or weight_threshold < 0:
             raise ValueError("The weight threshold must be a positive number!")
+        try:
+            dtype = np.dtype(dtype)  # accept every numpy spelling of the type, e.g. 'float32' or np.float32
+        except TypeError:
+            dtype = None
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("The dtype must be numpy.float32 or numpy.float64!")
 
         contents = dataframe.columns.values
         for s in stoves:
@@ -68,26 +191,76 @@ class Household:
             if f not in contents:
                 raise ValueError(f + ' fuel not found in the dataframe.')
 
-        self.df_stoves = dataframe.applymap(lambda i: i.lower() if type(i) == str else i)
+        self.df_stoves = dataframe.applymap(lambda i: i.lower() if isinstance(i, str) else i)
         self.stoves = [i.lower() for i in stoves]
         self.fuels = [i.lower() for i in fuels]
+        self._stove_set = frozenset(self.stoves)
+        self._fuel_set = frozenset(self.fuels)
         self.hh_id = hh_id
+        # results are cached per stove/fuel, changing a threshold below clears the matching cache
+        self._cook_events_cache = {}
+        self._fuel_cache = {}
         self.temp_threshold = temp_threshold
         self.time_between_events = time_between_events
-        self.study_duration = self.df_stoves['timestamp'].iloc[-1] - self.df_stoves['timestamp'][0]
-        self.study_days = round(self.study_duration.total_seconds()/86400) # rounding to the nearest day
         self.weight_threshold = weight_threshold
 
+        # sensor readings as arrays so the analysis never has to index into the dataframe one element at a time.
+        # They are contiguous copies in the requested dtype, so every calculation sees the same fixed layout and
+        # editing the dataframe afterwards can not change the cached results.
+        self._arr = {col: np.array(self.df_stoves[col], dtype=dtype, order='C')
+                     for col in self.stoves + self.fuels}
+        self._arr['timestamp'] = np.array(self.df_stoves['timestamp'], dtype='datetime64[ns]', order='C')
+        self._ts_ns = self._arr['timestamp'].view('i8')  # int64 nanoseconds, a view so nothing is copied
+        # datetime64 holds timezone aware timestamps as UTC, the plots show the wall-clock time of the readings instead
+        if getattr(self.df_stoves['timestamp'].dtype, 'tz', None) is None:
+            self._plot_times = self._arr['timestamp']
+        else:
+            self._plot_times = np.array(self.df_stoves['timestamp'].dt.tz_localize(None), dtype='datetime64[ns]',
+                                        order='C')
+        self.study_duration = pd.Timedelta(int(self._ts_ns[-1] - self._ts_ns[0]), unit='ns')
+        self.study_days = round(self.study_duration.total_seconds()/86400) # rounding to the nearest day
+        # the day of the study (24hr periods since the first reading) each reading was taken on
+        self._study_day = (self._ts_ns - self._ts_ns[0]) // _DAY_NS
+        for readings in [*self._arr.values(), self._plot_times, self._ts_ns, self._study_day]:
+            readings.flags.writeable = False
+
         self.stove_and_fuel_usage()
         self.plot_fuel(fuel_usage=True)
         self.plot_stove(cooking_events=True)
 
+    @property
+    def temp_threshold(self):
+        return self._temp_threshold
+
+    @temp_threshold.setter
+    def temp_threshold(self, value):
+        self._temp_threshold = value
+        self._cook_events_cache.clear()
+
+    @property
+    def time_between_events(self):
+        return self._time_between_events
+
+    @time_between_events.setter
+    def time_between_events(self, value):
+        self._time_between_events = value
+        self._cook_events_cache.clear()
+
+    @property
+    def weight_threshold(self):
+        return self._weight_threshold
+
+    @weight_threshold.setter
+    def weight_threshold(self, value):
+        self._weight_threshold = value
+        self._fuel_cache.clear()
+
     def _check_item(self, item):
         '''Check if stove or fuel input is in dataset
 
         Args:
             item (string): If only looking at one item, it must be input as a str. If looking at
-                            multiple items, they must be input as a list of items.
+                            multiple items, they must be input as a list (or any other iterable) of items.
         Returns:
             item_type (list) : If items are found in the stove list it will return a list of stoves. If items are found
                                 in the fuel list it will return a list of fuels. If items are found in neither or both
@@ -98,26 +271,26 @@ class Household:
         stove = False
         fuel = False
 
-        if item == "All Stoves":
+        # only compare strings to the "All" names, comparing an array or index to a string gives an array
+        if isinstance(item, str) and item == "All Stoves":
             item_type = self.stoves
-        elif item == "All Fuels":
+        elif isinstance(item, str) and item == "All Fuels":
             item_type = self.fuels
         else:
-            if type(item) != list:
+            if isinstance(item, str) or not isinstance(item, Iterable):
                 item = [item]
             for i in item:
-                if type(i) != str:
+                if not isinstance(i, str):
                     raise ValueError('Must input all items as strings!')
-                if i in self.stoves:
-                    item_type.append(i)
-                    stove = True
-                if i in self.fuels:
-                    item_type.append(i)
-                    fuel = True
+                is_stove = i in self._stove_set
+                is_fuel = i in self._fuel_set
+                if not is_stove and not is_fuel:
+                    raise ValueError(i + " was not found in dataset.")
+                stove = stove or is_stove
+                fuel = fuel or is_fuel
                 if stove and fuel:
                     raise ValueError('Put in only fuel or stoves not both!')
-                if not stove and not fuel:
-                    raise ValueError(i + " was not found in dataset.")
+                item_type.append(str(i))
         return item_type
 
     def _find_weight_changes(self, fuel):
@@ -127,41 +300,13 @@ class Household:
             fuel (str) : name of fuel in data set
 
         Returns:
-            weight_change (list): A list of all fuel change indices found that resulted in a change of fuel weight
+            weight_change (array): An array of all fuel change indices found that resulted in a change of fuel weight
                                        larger than the prescribed threshold (weight_threshold).
         '''
 
-        fuel_data = list(self.df_stoves[fuel])
-
-        weight = fuel_data[0]
-        weight_changes = []
-
-        for i, current_weight in enumerate(fuel_data[1:]):
-            if fuel == "lpg" and current_weight < 5:  # should change this to be more versatile later
-                pass
-            else:
-                if i == len(fuel_data)-2:
-                    if fuel_data[i] < weight:
-                        weight_changes.append(i+1)
-                else:
-                    weight_before = fuel_data[i]
-                    weight_after = fuel_data[i+2]
-                    weight_diff = current_weight - weight
-
-                    if abs(weight_diff) < self.weight_threshold:
-                        pass
-                    else:
-                        # check to make sure it isnt catching random peaks
-                        if weight_diff > self.weight_threshold:
-                            if abs(weight_after-weight_before) < self.weight_threshold or weight_after < weight_before:
-                                pass
-                            else:
-                                weight_changes.append(i+1)
-                                weight = current_weight
-                        else:
-                            weight_changes.append(i+1)
-                            weight = current_weight
-        return weight_changes
+        minimum_weight = 5 if fuel == "lpg" else -np.inf  # should change this to be more versatile later
+
+        return _significant_changes(self._arr[fuel], self.weight_threshold, minimum_weight)
 
     def _daily_fuel_use(self, fuel, weight_changes):
         '''Determine amount of fuel used in each 24hr period of study (Internal function).
@@ -169,55 +314,19 @@ class Household:
         Args:
             fuel (str): Name of fuel in dataset.
 
-            weight_changes (list): List of indices of all significant fuel changes for chosen fuel.
+            weight_changes (array): Indices of all significant fuel changes for chosen fuel.
 
         Returns:
-            daily_fuel_usage (dict): A dictionary containing fuel usage information for each day of study. Keys
-                                         represent the day of the study, values is the total weight change (kg) recorded
-                                         for that day of the study.
+            daily_fuel_usage (array): Fuel usage information for each day of study. The index is the day of the
+                                      study, values are the total weight change (kg) recorded for that day of the
+                                      study. Day 0 represents the total fuel usage.
         '''
 
-        daily_fuel_usage = {}
-        fuel_info = self.df_stoves[fuel]
-        day = 0
-        study_began = self.df_stoves['timestamp'][0]
-        weight = fuel_info[weight_changes[0]]
-        weight_diff = 0
-        total_fuel_usage = 0
-        for i in weight_changes[1:]:
-            day_of_use = (self.df_stoves['timestamp'][i] - study_began).days
-            new_weight = fuel_info[i]
-            if weight - new_weight < self.weight_threshold:
-                # indicates an adding of fuel not a fuel usage
-                pass
-            else:
-                total_fuel_usage += weight - new_weight
-                if day_of_use == self.study_days:
-                    if day_of_use in daily_fuel_usage:
-                        weight_diff += weight - new_weight
-                    else:
-                        weight_diff = weight - new_weight
-                    daily_fuel_usage.update({day_of_use: weight_diff})
-                elif day_of_use == day:
-                    weight_diff += weight - new_weight
-                    daily_fuel_usage.update({day+1: weight_diff})
-                else:
-                    weight_diff = weight - new_weight
-                    day = day_of_use
-
-                    daily_fuel_usage.update({day+1: weight_diff})
-            weight = new_weight
-
-        if len(daily_fuel_usage) != self.study_days:
-            for i in range(self.study_days):
-                day = i + 1
-                if day not in daily_fuel_usage:
-                    weight = 0
-                    daily_fuel_usage.update({day: weight})
-
-        daily_fuel_usage.update({0: total_fuel_usage})
-
-        return daily_fuel_usage
+        weights = self._arr[fuel][weight_changes].astype(np.float64)  # compared in float64 like the weight changes
+        fuel_used = weights[:-1] - weights[1:]
+        used = ~(fuel_used < self.weight_threshold)  # smaller changes indicate an adding of fuel not a fuel usage
+
+        return _daily_totals(self._study_day[weight_changes[1:]][used], fuel_used[used], self.study_days)
 
     def fuel_usage(self, fuel="All Fuels"):
         '''Determine the total amount of each fuel used on each day of the study.
@@ -229,29 +338,57 @@ class Household:
 
         Returns:
             self.weight_changes (dict): A dictionary of all significant fuel changes in study. Key is the fuel type,
-                                        values are lists of indices where significant fuel changes took place. This is
+                                        values are arrays of indices where significant fuel changes took place. This is
                                         used by another function internally.
 
             Daily fuel usage (dataframe): A dataframe, rows = fuel types, columns = day (24hr period) of study,
                                           values are the amount of fuel (kg) used in that day of study.
         '''
 
-      
-        fuel_type = self._check_item(fuel)
+        return self._fuel_usage(self._check_item(fuel))
 
-        fuel_change = []
-        fuel_weight_changes = {}  # will be used in other functions
+    def _fuel_usage(self, fuel_type):
+        '''Determine the total amount of each fuel used on each day of the study (internal function).
+
+        Args:
+            fuel_type (list): Fuels in the data set, already checked by _check_item.
+
+        Returns:
+            Daily fuel usage (dataframe): See fuel_usage.
+        '''
+
+        fuel_weight_changes = self._compute_weight_changes(fuel_type)
+
+        # rows = day of study, columns = fuel type, filled in place rather than built from a list of dictionaries
+        fuel_use = np.zeros((self.study_days + 1, len(fuel_type)))
         ind = []
-        for f in fuel_type:
-            changes = self._find_weight_changes(f)
-            fuel_weight_changes.update({f: changes})
-            daily_usage = self._daily_fuel_use(f, changes)
-            fuel_change.append(daily_usage)
+        for col, f in enumerate(fuel_type):
+            fuel_use[:, col] = self._daily_fuel_use(f, fuel_weight_changes[f])
             ind.append(f+"(kg)")
 
+        return pd.DataFrame(fuel_use, columns=ind)
+
+    def _compute_weight_changes(self, fuel_type):
+        '''Find the significant weight changes of each fuel without building the usage dataframe (internal function).
+
+        Args:
+            fuel_type (list): Fuels in the data set, already checked by _check_item.
+
+        Returns:
+            self.weight_changes (dict): A dictionary of all significant fuel changes in study. Key is the fuel type,
+                                        values are arrays of indices where significant fuel changes took place.
+        '''
+
+        fuel_weight_changes = {}  # will be used in other functions
+        for f in fuel_type:
+            if f not in self._fuel_cache:
+                changes = self._find_weight_changes(f)
+                changes.flags.writeable = False  # shared through self.weight_changes
+                self._fuel_cache[f] = changes
+            fuel_weight_changes.update({f: self._fuel_cache[f]})
+
         self.weight_changes = fuel_weight_changes
-        fuel_use = pd.DataFrame(fuel_change, index=ind).transpose()
-        return fuel_use.sort_index(ascending=True)
+        return fuel_weight_changes
 
     def cooking_events(self, stove="All Stoves"):
         ''' Determine the number of cooking events on each stove during study.
@@ -267,59 +404,39 @@ class Household:
 
           '''
 
-        stove_type = self._check_item(stove)
+        return self._cooking_events(self._check_item(stove))
+
+    def _cooking_events(self, stove_type):
+        '''Determine the cooking events on each stove during study (internal function).
+
+        Args:
+            stove_type (list): Stoves in the data set, already checked by _check_item.
+
+        Returns:
+            cook_events (dict) : See cooking_events.
+        '''
+
         cook_events = {}
 
         for s in stove_type:
-            stove_temps = self.df_stoves[s]
-            possible_cooking_events = find_peaks(stove_temps, height=self.temp_threshold
-                               , distance=self.time_between_events)[0]
-            events = []
-            for i in possible_cooking_events:
-                before_event = stove_temps[:i]
-                after_event = stove_temps[i:]
-                start_time = False
-                end_time = False
-                min_below_threshold = 0
-                for j, temp in enumerate(before_event[::-1]):
-                    if j == len(before_event)-2:
-                        start_time = 0
-                        min_below_threshold = 0
-                        break
-                    elif temp < self.temp_threshold:
-                        min_below_threshold += 1
-                        if min_below_threshold == 5:
-                            start_time = i - j
-                            min_below_threshold = 0
-                            break
-                    else:
-                        min_below_threshold = 0
-                for k, t in enumerate(after_event):
-                    if k == len(after_event)-2:
-                        end_time = len(stove_temps)-1
-                        break
-                    elif t < self.temp_threshold:
-                        min_below_threshold += 1
-                        if min_below_threshold == 5:
-                            end_time = i + k
-                            break
-                    else:
-                        min_below_threshold = 0
-                if not start_time:
-                    raise ValueError('Could not find start time for cooking event on ' + stove + ' at index: ', i)
-                if not end_time:
-                    raise ValueError('Could not find end time for cooking event on ' + stove + ' at index: ', i)
-                if events:
-                    previous_event = events[-1]
-                    if previous_event[1] == start_time:
-                        pass
-                    if previous_event[2] > start_time:
-                        start_time = previous_event[2] + 1
-                    else:
-                        events.append([i, start_time, end_time])
-                else:
+            if s not in self._cook_events_cache:
+                stove_temps = self._arr[s]
+                possible_cooking_events = find_peaks(stove_temps, height=self.temp_threshold
+                                   , distance=self.time_between_events)[0]
+                starts, ends = _cooking_boundaries(stove_temps, possible_cooking_events, self.temp_threshold)
+                events = []
+                for i, start_time, end_time in zip(possible_cooking_events.tolist(), starts.tolist(), ends.tolist()):
+                    if not start_time:
+                        raise ValueError('Could not find start time for cooking event on ' + s + ' at index: ', i)
+                    if not end_time:
+                        raise ValueError('Could not find end time for cooking event on ' + s + ' at index: ', i)
+                    if events and events[-1][2] > start_time:
+                        # overlaps the previous cooking event
+                        continue
                     events.append([i, start_time, end_time])
-            cook_events.update({s: events})
+                self._cook_events_cache[s] = events
+            # copies so changes made by the caller do not end up in the cache
+            cook_events.update({s: [event.copy() for event in self._cook_events_cache[s]]})
         return cook_events
 
     def _daily_cooking_time(self, cooking_events):
@@ -330,54 +447,20 @@ class Household:
                                           of cooking, end of cooking] as the values
 
         Returns:
-                daily_cooking (dict): A dictionary containing stove cooking information for each day of study. Keys
-                                      represent the day of the study, values are the total time(min) cooking recorded
-                                      for that day of the study. Day 0 represents the total amount of cooking time.
+                daily_cooking (array): Stove cooking information for each day of study. The index is the day of the
+                                       study, values are the total time(min) cooking recorded for that day of the
+                                       study. Day 0 represents the total amount of cooking time.
 
         '''
 
-        day = 0
-        daily_cooking = {}
-        study_began = self.df_stoves['timestamp'][0]
-        daily_mins = 0
-        total_mins= 0
-
-        for i in cooking_events:
-            for j, idx in enumerate(cooking_events[i]):
-                end_time = self.df_stoves['timestamp'][idx[2]]
-                start_time = self.df_stoves['timestamp'][idx[1]]
-                days_since_start = (end_time - study_began).days
-                total_mins += (end_time - start_time).seconds / 60
-                if days_since_start != day:
-                    daily_cooking.update({day+1: daily_mins})
-                    day = days_since_start
-                    daily_mins = (end_time - start_time).seconds / 60
-                    if j == len(cooking_events[i]) - 1:
-                        if days_since_start == self.study_days:
-                            day = days_since_start
-                        else:
-                            day += 1
-                        daily_cooking.update({day: daily_mins})
-                        break
-                elif j == len(cooking_events[i]) - 1:
-                    daily_mins += (end_time - start_time).seconds / 60
-                    if days_since_start == self.study_days:
-                        day = days_since_start
-                    else:
-                        day += 1
-                    daily_cooking.update({day: daily_mins})
-                else:
-                    daily_mins += (end_time - start_time).seconds / 60
-            if len(daily_cooking) != self.study_days:
-                for i in range(self.study_days):
-                    day = i + 1
-                    if day not in daily_cooking:
-                        mins = 0
-                        daily_cooking.update({day: mins})
-
-            daily_cooking.update({0: total_mins})
-
-        return daily_cooking
+        events = [event for stove in cooking_events for event in cooking_events[stove]]
+        events = np.array(events, dtype=np.int64).reshape(-1, 3)
+        start_time = self._ts_ns[events[:, 1]]
+        end_time = self._ts_ns[events[:, 2]]
+        # only the seconds within a day are counted, the same as timedelta.seconds
+        mins = (end_time - start_time) // 10**9 % 86400 / 60
+
+        return _daily_totals(self._study_day[events[:, 2]], mins, self.study_days)
 
     def cooking_duration(self, stove="All Stoves"):
         '''Determines the cooking duration (mins) on each stove for each day of the study.
@@ -392,17 +475,15 @@ class Household:
 
         '''
         stove_type = self._check_item(stove)
-        all_cooking_info = []
+        cooking_times = np.zeros((self.study_days + 1, len(stove_type)))
         ind = []
 
-        for s in stove_type:
-            daily_cooking = self._daily_cooking_time(self.cooking_events(s))
+        for col, s in enumerate(stove_type):
+            daily_cooking = self._daily_cooking_time(self._cooking_events([s]))
             ind.append(s+'(min)')
-            all_cooking_info.append(daily_cooking)
-
-        cooking_times = pd.DataFrame(all_cooking_info, index=ind).transpose()
+            cooking_times[:, col] = daily_cooking
 
-        return cooking_times.sort_index(ascending=True)
+        return pd.DataFrame(cooking_times, columns=ind)
 
     def _color_assignment(self, item):
         '''Temporary means of assigning colors.'''
@@ -438,72 +519,68 @@ class Household:
         cooking_colors = {"start": "turquoise",
                           "peak": 'red',
                           "end": "black"}
-        fig = go.Figure()
 
-        fig.update_yaxes(title_text="Temp")
-        fig.update_xaxes(title_text="Time")
-        fig.update_layout(title_text="Household: " + self.hh_id + " " + stove + " Stove Temperature")
+        timestamps = self._plot_times
 
-        for s in stove_type:
-            fig.add_trace(go.Scatter(
-                x=self.df_stoves['timestamp'],
-                y=self.df_stoves[s].values,
-                mode='lines',
-                marker=dict(
-                        color=colors[s],
-                        size=5),
-                name=s.split(' ')[0],
-                legendgroup= s
-            ))
+        # Scattergl draws with WebGL, which stays responsive for the long sensor traces
+        traces = [go.Scattergl(
+                    x=timestamps,
+                    y=self._arr[s],
+                    mode='lines',
+                    marker=dict(
+                            color=colors[s],
+                            size=5),
+                    name=s.split(' ')[0],
+                    legendgroup=s
+                    ) for s in stove_type]
 
         if cooking_events:
-            events = self.cooking_events(stove)
+            events = self._cooking_events(stove_type)
 
             for s in stove_type:
-                peak = []
-                start = []
-                end = []
-                for point in events[s]:
-                    peak.append(point[0])
-                    start.append(point[1])
-                    end.append(point[2])
-
-                fig.add_trace(
-                                go.Scatter(x=self.df_stoves['timestamp'][peak],
-                                           y=self.df_stoves[s][peak],
-                                           mode='markers',
-                                           marker=dict(
-                                                    color=cooking_colors['peak'],
-                                                    size=5),
-                                           name=s + ' Cooking Events',
-                                           legendgroup=s
-
-                                           )
-                            )
-                fig.add_trace(
-                                go.Scatter(x=self.df_stoves['timestamp'][start],
-                                           y=self.df_stoves[s][start],
-                                           mode='markers',
-                                           marker=dict(
-                                                    color=cooking_colors['start'],
-                                                    size=10,
-                                                    symbol='triangle-right'),
-                                           name=s + ' Cooking start',
-                                           legendgroup=s
-                                           )
-                            )
-                fig.add_trace(
-                                go.Scatter(x=self.df_stoves['timestamp'][end],
-                                           y=self.df_stoves[s][end],
-                                           mode='markers',
-                                           marker=dict(
-                                                    color=cooking_colors['end'],
-                                                    size=10,
-                                                    symbol='triangle-left'),
-                                           name=s + ' Cooking end',
-                                           legendgroup=s
-                                           )
-                            )
+                points = np.array(events[s], dtype=np.int64).reshape(-1, 3)
+                peak = points[:, 0]
+                start = points[:, 1]
+                end = points[:, 2]
+
+                traces += [
+                            go.Scattergl(x=timestamps[peak],
+                                         y=self._arr[s][peak],
+                                         mode='markers',
+                                         marker=dict(
+                                                color=cooking_colors['peak'],
+                                                size=5),
+                                         name=s + ' Cooking Events',
+                                         legendgroup=s
+                                         ),
+                            go.Scattergl(x=timestamps[start],
+                                         y=self._arr[s][start],
+                                         mode='markers',
+                                         marker=dict(
+                                                color=cooking_colors['start'],
+                                                size=10,
+                                                symbol='triangle-right'),
+                                         name=s + ' Cooking start',
+                                         legendgroup=s
+                                         ),
+                            go.Scattergl(x=timestamps[end],
+                                         y=self._arr[s][end],
+                                         mode='markers',
+                                         marker=dict(
+                                                color=cooking_colors['end'],
+                                                size=10,
+                                                symbol='triangle-left'),
+                                         name=s + ' Cooking end',
+                                         legendgroup=s
+                                         )
+                          ]
+
+        # building the figure from every trace at once avoids validating the figure again for each add_trace
+        fig = go.Figure(data=traces)
+
+        fig.update_yaxes(title_text="Temp")
+        fig.update_xaxes(title_text="Time")
+        fig.update_layout(title_text="Household: " + self.hh_id + " " + stove + " Stove Temperature")
 
         return fig.show()
 
@@ -526,19 +603,13 @@ class Household:
         # fuel_type = self.check_fuel_type(fuel)
         fuel_type = self._check_item(fuel)
 
-        fig = go.Figure()
-
         colors = self._color_assignment(fuel_type)
 
-        fig.update_yaxes(title_text="Weight")
-        fig.update_xaxes(title_text="Time")
-        fig.update_layout(title_text="Household: " + self.hh_id + " " + fuel + " Weight Readings")
+        timestamps = self._plot_times
 
-        for f in fuel_type:
-            fig.add_trace(
-                go.Scatter(
-                    x=self.df_stoves['timestamp'],
-                    y=self.df_stoves[f].values,
+        traces = [go.Scattergl(
+                    x=timestamps,
+                    y=self._arr[f],
                     mode='lines',
                     marker=dict(
                                 color=colors[f],
@@ -546,25 +617,28 @@ class Household:
                                 ),
                     name=f.split(' ')[0],
                     legendgroup=f
-                ))
+                    ) for f in fuel_type]
 
         if fuel_usage:
-            self.fuel_usage(fuel=fuel_type)
-            changes = self.weight_changes
-
-            for f in fuel_type:
-                fig.add_trace(
-                    go.Scatter(x=self.df_stoves['timestamp'][changes[f]],
-                               y=self.df_stoves[f][changes[f]],
-                               mode='markers',
-                               marker=dict(
-                                color='red',
-                                size=5
-                                ),
-                               name=f + ' Weight Change',
-                               legendgroup=f
-                               )
-                )
+            changes = self._compute_weight_changes(fuel_type)
+
+            traces += [go.Scattergl(x=timestamps[changes[f]],
+                                    y=self._arr[f][changes[f]],
+                                    mode='markers',
+                                    marker=dict(
+                                        color='red',
+                                        size=5
+                                        ),
+                                    name=f + ' Weight Change',
+                                    legendgroup=f
+                                    ) for f in fuel_type]
+
+        fig = go.Figure(data=traces)
+
+        fig.update_yaxes(title_text="Weight")
+        fig.update_xaxes(title_text="Time")
+        fig.update_layout(title_text="Household: " + self.hh_id + " " + fuel + " Weight Readings")
+
         return fig.show()
 
     def stove_and_fuel_usage(self):
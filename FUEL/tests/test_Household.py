@@ -1,7 +1,59 @@
-from ..household import Household
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from ..household import Household, _significant_changes
 from ..example_file_convert import reformat_example_files as reformat
 
 
+def reference_weight_changes(fuel_data, threshold, minimum_weight):
+    '''Reading by reading weight change check, written the same way as the original household.py loop.'''
+
+    weight = fuel_data[0]
+    weight_changes = []
+    for i, current_weight in enumerate(fuel_data[1:]):
+        if current_weight < minimum_weight:
+            pass
+        elif i == len(fuel_data)-2:
+            if fuel_data[i] < weight:
+                weight_changes.append(i+1)
+        else:
+            weight_before = fuel_data[i]
+            weight_after = fuel_data[i+2]
+            weight_diff = current_weight - weight
+            if abs(weight_diff) < threshold:
+                pass
+            elif weight_diff > threshold:
+                if abs(weight_after-weight_before) < threshold or weight_after < weight_before:
+                    pass
+                else:
+                    weight_changes.append(i+1)
+                    weight = current_weight
+            else:
+                weight_changes.append(i+1)
+                weight = current_weight
+    return weight_changes
+
+
+def test_significant_changes_reference():
+    '''Testing the weight change kernel against the reading by reading check, including NaNs and the lpg cut-off'''
+
+    rng = np.random.default_rng(0)
+    for n in [1, 2, 3, 255, 256, 257, 600]:
+        for trial in range(20):
+            steps = rng.choice([0, 0, 0, 0.1, -0.1, 0.3, -0.3, 1, -1], size=n)
+            weights = np.round(np.cumsum(steps) + 6, 2)
+            weights[rng.integers(0, n, size=n // 100)] = np.nan
+            for threshold in [0.05, 0.2]:
+                for minimum_weight in [-np.inf, 5]:
+                    for dtype in [np.float64, np.float32]:
+                        readings = weights.astype(dtype)
+                        expected = reference_weight_changes(readings.tolist(), threshold, minimum_weight)
+                        result = _significant_changes(readings, threshold, minimum_weight)
+                        assert result.tolist() == expected
+
+
 file_paths = ['HH_38_2018-08-26_15-01-40_processed_v3.csv',
              'HH_44_2018-08-17_13-49-22_processed_v2.csv',
              'HH_141_2018-08-17_17-50-31_processed_v2.csv',
@@ -46,6 +98,21 @@ for file in file_paths:
             assert j in df.columns
 
 
+    def test_check_item_not_found():
+        '''Testing that the check item function rejects an unknown item even after a valid one'''
+
+        with pytest.raises(ValueError):
+            x._check_item((stoves[0], 'not a stove'))
+
+
+    def test_check_item_arrays():
+        '''Testing that the check item function accepts numpy arrays and pandas indexes of items'''
+
+        for items in [np.array(stoves), pd.Index(stoves), pd.Series(fuels)]:
+            assert x._check_item(items) == list(items)
+        assert list(x.cooking_duration(np.array(stoves)).columns) == [s + '(min)' for s in stoves]
+
+
     def test_find_weight_changes():
         """Test the _find_significant_weight_changes actually records weights that are greater than the threshold"""
 
@@ -110,6 +177,19 @@ for file in file_paths:
                 assert current_start > previous_end
 
 
+    def test_cooking_events_threshold_change():
+        '''Testing that changing the temperature threshold recalculates the cached cooking events'''
+
+        x.cooking_events()
+        temp_threshold = x.temp_threshold
+        x.temp_threshold = int(max(x.df_stoves[s].max() for s in stoves)) + 1
+        try:
+            for events in x.cooking_events().values():
+                assert not events
+        finally:
+            x.temp_threshold = temp_threshold
+
+
     def test_daily_cooking_time_size():
         '''Testing that the function returns data for every day of study'''
 
@@ -145,3 +225,48 @@ for file in file_paths:
 
         for s in stoves:
             assert s+'(min)' in x.cooking_duration().columns
+
+
+    def test_plot_timezone(monkeypatch):
+        '''Testing that timezone aware timestamps are plotted at their wall-clock time, not converted to UTC'''
+
+        figures = []
+        monkeypatch.setattr(go.Figure, 'show', lambda fig: figures.append(fig))
+        df_tz = df.copy()
+        df_tz['timestamp'] = df_tz['timestamp'].dt.tz_localize('Africa/Nairobi')
+        x_tz = Household(df_tz, stoves, fuels, hh_id)
+
+        wall_clock = df_tz['timestamp'].dt.tz_localize(None).to_numpy()
+        assert len(figures) == 2  # the fuel and stove plots drawn by the constructor
+        for fig in figures:
+            assert np.array_equal(fig.data[0].x, wall_clock)
+        assert x_tz.study_days == x.study_days
+
+
+    def test_float32_fuel_usage():
+        '''Testing that analysing the readings as float32 gives the same fuel usage as float64'''
+
+        x32 = Household(df, stoves, fuels, hh_id, dtype='float32')
+
+        for f in fuels:
+            assert x32._arr[f].dtype == np.float32
+        assert np.allclose(x32.fuel_usage().values, x.fuel_usage().values, atol=1e-4)
+
+
+    def test_float32_fuel_usage_exact():
+        '''Testing that float32 readings give exactly the fuel usage of the same readings analysed as float64'''
+
+        df32 = df.copy()
+        df32[fuels] = df32[fuels].astype(np.float32).astype(np.float64)
+        x32 = Household(df, stoves, fuels, hh_id, dtype=np.float32)
+        x64 = Household(df32, stoves, fuels, hh_id)
+
+        assert np.array_equal(x32.fuel_usage().values, x64.fuel_usage().values)
+
+
+    def test_invalid_dtype():
+        '''Testing that only float32 and float64 are accepted as the reading dtype'''
+
+        for dtype in [np.int64, 'float16', 'not a dtype']:
+            with pytest.raises(ValueError):
+                Household(df, stoves, fuels, hh_id, dtype=dtype)